@@ -6,6 +6,7 @@ from django.db import models
 class Department(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=100, unique=True)
+    is_active = models.BooleanField(default=True)
 
 
 class Employee(models.Model):
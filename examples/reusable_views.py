@@ -32,3 +32,19 @@ class ReusableAsyncReadView(APIView):
 
     async def handler(self, request: HttpRequest, id: UUID) -> models.Model:
         return await self.model.objects.aget(id=id)
+
+
+class ReusableSoftDeleteView(APIView):
+    def __init__(
+        self,
+        model: Optional[type[models.Model]] = None,
+        field: str = "is_active",
+    ) -> None:
+        super().__init__("/{id}/reusable", methods=["DELETE"], status_code=204)
+        self.model = model
+        self.field = field
+
+    def handler(self, request: HttpRequest, id: UUID) -> None:
+        updated = self.model.objects.filter(id=id).update(**{self.field: False})
+        if not updated:
+            raise self.model.DoesNotExist()
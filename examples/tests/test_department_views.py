@@ -200,3 +200,25 @@ class TestDepartmentViewSet(APITestCase):
                 ),
             ],
         )
+
+    def test_reusable_soft_delete_department(self):
+        def assert_department_deactivated(response, scenario):
+            department = Department.objects.get(id=self.department_1.id)
+            self.assertFalse(department.is_active)
+
+        self.assertScenariosSucceed(
+            method="DELETE",
+            path="/api/departments/{id}/reusable",
+            scenarios=[
+                APIViewTestScenario(
+                    path_parameters={"id": self.department_1.id},
+                    expected_response_status=HTTPStatus.NO_CONTENT,
+                    expected_response_body=b"",
+                    assertions=assert_department_deactivated,
+                ),
+                APIViewTestScenario(
+                    path_parameters={"id": uuid.uuid4()},
+                    expected_response_status=HTTPStatus.NOT_FOUND,
+                ),
+            ],
+        )
@@ -44,3 +44,6 @@ class DepartmentViewSet(viewsets.APIViewSet):
         model=Department,
         response_schema=DepartmentOut,
     )
+    reusable_soft_delete_department = reusable_views.ReusableSoftDeleteView(
+        model=Department,
+    )
@@ -1,4 +1,5 @@
 from .api_view import APIView
+from .bulk_delete_view import BulkDeleteView
 from .create_view import CreateView
 from .delete_view import DeleteView
 from .list_view import ListView
@@ -12,4 +13,5 @@ __all__ = [
     "ReadView",
     "UpdateView",
     "DeleteView",
+    "BulkDeleteView",
 ]
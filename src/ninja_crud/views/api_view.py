@@ -1,6 +1,7 @@
 import abc
 import asyncio
 import functools
+import inspect
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union, get_args, get_origin
 
 import django.db.models
@@ -203,7 +204,7 @@ class APIView(abc.ABC):
         self.status_code = status_code
         self.responses = responses or {}
         self.name = name
-        self.decorators = decorators or []
+        self.decorators = list(decorators or [])
         self.operation_kwargs = operation_kwargs or {}
         self._api_viewset_class: Optional[type[APIViewSet]] = None
 
@@ -326,6 +327,36 @@ class APIView(abc.ABC):
 
         return standalone_handler
 
+    @staticmethod
+    def _resolve_field_type(field: Any) -> Any:
+        # Django Ninja types nullable fields as Optional[...], which is unwrapped as
+        # resolved values are always required, e.g. for path parameters.
+        schema_field = ninja.orm.fields.get_schema_field(field=field)[0]
+        return (
+            get_args(schema_field)[0]
+            if get_origin(schema_field) is Union
+            else schema_field
+        )
+
+    @staticmethod
+    def _annotate_handler(
+        handler: Callable[..., Any], **annotations: Any
+    ) -> Callable[..., Any]:
+        # The standalone handler shares `__annotations__` with the class method through
+        # `functools.wraps`, so both the annotations and the signature Django Ninja
+        # inspects are replaced rather than mutated, leaving other views untouched.
+        signature = inspect.signature(handler)
+        handler.__annotations__ = {**handler.__annotations__, **annotations}
+        handler.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[
+                parameter.replace(
+                    annotation=annotations.get(parameter.name, parameter.annotation)
+                )
+                for parameter in signature.parameters.values()
+            ]
+        )
+        return handler
+
     @property
     def api_viewset_class(self) -> Optional[type["APIViewSet"]]:
         return self._api_viewset_class
@@ -355,7 +386,8 @@ class APIView(abc.ABC):
         refactoring repetitive endpoints into an APIView subclass.
 
         Utilizes Django Ninja utilities to extract and map path parameters to model
-        fields. Returns `None` if no parameters are found.
+        fields. Returns `None` if no parameters are found. Results are cached per path
+        and model, so views sharing both also share the same pydantic model type.
 
         Args:
             model (type[django.db.models.Model] | None): The associated Django model.
@@ -383,19 +415,20 @@ class APIView(abc.ABC):
             Prefer simple types (strings, integers, UUIDs) for path parameters to
             ensure proper URL formatting and web standard compatibility.
         """
-        path_parameters_names = ninja.signature.utils.get_path_param_names(self.path)
-        if not path_parameters_names:
-            return None
-
-        schema_fields: dict[str, Any] = {}
-        for field_name in path_parameters_names:
-            model_field = model._meta.get_field(field_name)
-            schema_field = ninja.orm.fields.get_schema_field(field=model_field)[0]
-            schema_fields[field_name] = (
-                get_args(schema_field)[0]
-                if get_origin(schema_field) is Union
-                else schema_field,
-                ...,
-            )
+        return _resolve_path_parameters(self.path, model)
+
+
+@functools.cache
+def _resolve_path_parameters(
+    path: str, model: type[django.db.models.Model]
+) -> Optional[type[pydantic.BaseModel]]:
+    path_parameters_names = ninja.signature.utils.get_path_param_names(path)
+    if not path_parameters_names:
+        return None
+
+    schema_fields: dict[str, Any] = {}
+    for field_name in path_parameters_names:
+        model_field = model._meta.get_field(field_name)
+        schema_fields[field_name] = (APIView._resolve_field_type(model_field), ...)
 
-        return pydantic.create_model("PathParameters", **schema_fields)
+    return pydantic.create_model("PathParameters", **schema_fields)
@@ -0,0 +1,165 @@
+from typing import Annotated, Any, Callable, Optional, Union, cast
+
+import pydantic
+from django.db.models import Model, QuerySet
+from django.http import HttpRequest
+from ninja.params.functions import Body, Path
+from pydantic import BaseModel
+
+from ninja_crud.views.api_view import APIView
+from ninja_crud.views.types import Decorator, QuerySetGetter
+
+
+class BulkDeleteView(APIView):
+    """
+    Declarative class-based view for deleting multiple model instances in Django Ninja.
+
+    This class provides a standard implementation for a bulk delete view, which
+    deletes every model instance whose primary key is listed in the request body,
+    using a single `queryset.filter(pk__in=ids).delete()` call instead of one request
+    per instance. Cascades and signals are preserved, as the deletion goes through
+    the Django ORM. It is intended to be used in viewsets or as standalone views to
+    simplify the creation of bulk delete endpoints.
+
+    Args:
+        name (str | None, optional): View function name. Defaults to `None`. If None,
+            uses class attribute name in viewsets or "handler" for standalone views.
+        methods (list[str] | set[str], optional): HTTP methods. Defaults to `["DELETE"]`.
+        path (str, optional): URL path. Defaults to `"/"`.
+        response_status (int, optional): HTTP response status code. Defaults to `204`.
+        response_body (Any, optional): Response body type. Defaults to `None`.
+        model (type[django.db.models.Model], optional): Associated Django model.
+            Inherits from viewset if not provided. Defaults to `None`.
+        path_parameters (type[BaseModel], optional): Path parameters type.
+            Defaults to `None`. If not provided, resolved from the path and model.
+        request_body (type[BaseModel], optional): Request body type. Must expose the
+            primary keys to delete as an `ids` field. Defaults to `None`. If not
+            provided, resolved from the model as `{"ids": list[<primary key type>]}`.
+        get_queryset (Callable | None, optional): Callable to retrieve the queryset
+            the primary keys are looked up in. Default uses
+            `self.model.objects.get_queryset()`. Useful for scoping the deletion,
+            e.g., to the instances related to the path parameters.
+            Should have the signature:
+            - `(request: HttpRequest, path_parameters: Optional[BaseModel]) -> QuerySet`
+        decorators (list[Callable], optional): View function decorators
+            (applied in reverse order). Defaults to `None`.
+        operation_kwargs (dict[str, Any], optional): Additional operation
+            keyword arguments. Defaults to `None`.
+
+    Example:
+    ```python
+    from ninja import NinjaAPI
+    from ninja_crud import views, viewsets
+
+    from examples.models import Department
+
+    api = NinjaAPI()
+
+    # Usage as a class attribute in a viewset:
+    class DepartmentViewSet(viewsets.APIViewSet):
+        api = api
+        model = Department
+
+        bulk_delete_departments = views.BulkDeleteView()
+
+    # Usage as a standalone view:
+    views.BulkDeleteView(
+        name="bulk_delete_departments",
+        model=Department,
+    ).add_view_to(api)
+    ```
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        methods: Union[list[str], set[str], None] = None,
+        path: str = "/",
+        response_status: int = 204,
+        response_body: Any = None,
+        model: Optional[type[Model]] = None,
+        path_parameters: Optional[type[BaseModel]] = None,
+        request_body: Optional[type[BaseModel]] = None,
+        get_queryset: Optional[QuerySetGetter] = None,
+        decorators: Optional[list[Decorator]] = None,
+        operation_kwargs: Optional[dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            methods=methods or ["DELETE"],
+            path=path,
+            status_code=response_status,
+            response_schema=response_body,
+            decorators=decorators,
+            operation_kwargs=operation_kwargs,
+        )
+        self.model = model
+        self.decorators.append(self._update_handler_annotations)
+        self.path_parameters = path_parameters
+        self.request_body = request_body
+        self.get_queryset = get_queryset or self._default_get_queryset
+
+    def handler(
+        self,
+        request: HttpRequest,
+        path_parameters: Optional[BaseModel],
+        request_body: BaseModel,
+    ) -> None:
+        queryset = self.get_queryset(request, path_parameters)
+        queryset.filter(pk__in=request_body.ids).delete()  # type: ignore[attr-defined]
+
+    def _update_handler_annotations(
+        self, handler: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        return self._annotate_handler(
+            handler,
+            path_parameters=Annotated[
+                self.path_parameters, Path(default=None, include_in_schema=False)
+            ],
+            request_body=Annotated[self.request_body, Body()],
+        )
+
+    def _default_get_queryset(
+        self, request: HttpRequest, path_parameters: Optional[BaseModel]
+    ) -> QuerySet[Model]:
+        return cast(type[Model], self.model).objects.get_queryset()
+
+    def resolve_request_body(self, model: type[Model]) -> type[BaseModel]:
+        """
+        Resolve the default request body to a pydantic model listing the primary keys
+        to delete, typed after the model's primary key field.
+
+        Args:
+            model (type[django.db.models.Model]): The associated Django model.
+
+        Returns:
+            type[pydantic.BaseModel]: Request body pydantic model type.
+
+        Example:
+            For a `Department` model with a UUID primary key:
+
+            ```python
+            class BulkDeleteRequestBody(pydantic.BaseModel):
+                ids: list[UUID]
+            ```
+        """
+        pk_type = self._resolve_field_type(model._meta.pk)
+        return pydantic.create_model(
+            "BulkDeleteRequestBody",
+            ids=(list[pk_type], ...),  # type: ignore[valid-type]
+        )
+
+    def as_operation(self) -> dict[str, Any]:
+        if self.api_viewset_class:
+            self.model = self.model or self.api_viewset_class.model
+
+        if not self.model:
+            raise ValueError(
+                f"Unable to determine model for view {self.name}. "
+                "Please set a model either on the view or on its associated viewset."
+            )
+        self.path_parameters = self.path_parameters or self.resolve_path_parameters(
+            self.model
+        )
+        self.request_body = self.request_body or self.resolve_request_body(self.model)
+        return super().as_operation()
@@ -1,4 +1,3 @@
-from types import FunctionType
 from typing import Annotated, Any, Callable, Optional, Union, cast
 
 from django.db.models import ManyToManyField, Model
@@ -144,12 +143,13 @@ class CreateView(APIView):
     def _update_handler_annotations(
         self, handler: Callable[..., Any]
     ) -> Callable[..., Any]:
-        annotations = cast(FunctionType, handler).__annotations__
-        annotations["path_parameters"] = Annotated[
-            self.path_parameters, Path(default=None, include_in_schema=False)
-        ]
-        annotations["request_body"] = Annotated[self.request_body, Body()]
-        return handler
+        return self._annotate_handler(
+            handler,
+            path_parameters=Annotated[
+                self.path_parameters, Path(default=None, include_in_schema=False)
+            ],
+            request_body=Annotated[self.request_body, Body()],
+        )
 
     def _default_init_model(
         self, request: HttpRequest, path_parameters: Optional[BaseModel]
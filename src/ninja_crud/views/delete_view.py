@@ -1,7 +1,8 @@
-from types import FunctionType
+import functools
 from typing import Annotated, Any, Callable, Optional, Union, cast
 
-from django.db.models import Model
+from django.db import router, transaction
+from django.db.models import Model, signals
 from django.http import HttpRequest
 from ninja.params.functions import Path
 from pydantic import BaseModel
@@ -15,9 +16,13 @@ class DeleteView(APIView):
     Declarative class-based view for deleting a model instance in Django Ninja.
 
     This class provides a standard implementation for a delete view, which retrieves
-    a single model instance based on the path parameters and deletes it. It is
-    intended to be used in viewsets or as standalone views to simplify the creation
-    of delete endpoints.
+    a single model instance based on the path parameters and deletes it. Retrieval,
+    `pre_delete` and deletion share a single transaction, and `post_delete` runs
+    once it is committed. When `get_model`, `pre_delete` and `post_delete` are not
+    provided, the path parameters include the primary key and the model does not
+    override `delete()`, the instance is deleted with a single `queryset.delete()`
+    call instead, without being retrieved first. It is intended to be used in
+    viewsets or as standalone views to simplify the creation of delete endpoints.
 
     Args:
         name (str | None, optional): View function name. Defaults to `None`. If None,
@@ -32,8 +37,13 @@ class DeleteView(APIView):
         path_parameters (type[BaseModel], optional): Path parameters type.
             Defaults to `None`. If not provided, resolved from the path and model.
         get_model ((HttpRequest, BaseModel | None) -> Model, optional): Retrieves model
-            instance. Default uses path parameters (e.g., `self.model.objects.get(id=path_parameters.id)`
-            for `/{id}` path). Useful for customizing model retrieval logic.
+            instance. Default uses path parameters and locks the row until the deletion
+            is committed (e.g., `self.model.objects.select_for_update().get(id=path_parameters.id)`
+            for `/{id}` path). When `pre_delete` and `post_delete` are not provided,
+            the model does not override `delete()` and no `pre_delete`/`post_delete`
+            signal receivers are connected for the model, only the primary key is
+            fetched, as nothing else is needed to delete.
+            Useful for customizing model retrieval logic.
             Should have the signature:
             - `(request: HttpRequest, path_parameters: Optional[BaseModel]) -> Model`
         pre_delete ((HttpRequest, Model) -> None, optional): A callable to perform
@@ -41,7 +51,12 @@ class DeleteView(APIView):
             Useful for additional operations before deleting the instance.
         post_delete ((HttpRequest, Model) -> None, optional): A callable to perform
             post-delete operations on the model instance. By default, it does nothing.
-            Useful for additional operations after deleting the instance.
+            Called once the deletion is committed, so it never observes a deletion
+            that is later rolled back. As it runs through `transaction.on_commit`,
+            it is never called within Django's `TestCase`, whose transactions are
+            never committed, unless the test wraps the request in
+            `self.captureOnCommitCallbacks(execute=True)`. Useful for additional
+            operations after deleting the instance, such as cache invalidation.
         decorators (list[Callable], optional): View function decorators
             (applied in reverse order). Defaults to `None`.
         operation_kwargs (dict[str, Any], optional): Additional operation
@@ -99,35 +114,71 @@ class DeleteView(APIView):
         self.decorators.append(self._update_handler_annotations)
         self.path_parameters = path_parameters
         self.get_model = get_model or self._default_get_model
-        self.pre_delete = pre_delete or (lambda request, instance: None)
-        self.post_delete = post_delete or (lambda request, instance: None)
+        self.pre_delete = pre_delete or self._default_pre_delete
+        self.post_delete = post_delete or self._default_post_delete
+        self._delete_by_lookup = False
 
     def handler(
         self,
         request: HttpRequest,
         path_parameters: Optional[BaseModel],
     ) -> None:
-        instance = self.get_model(request, path_parameters)
-        self.pre_delete(request, instance)
-        instance.delete()
-        self.post_delete(request, instance)
+        model = cast(type[Model], self.model)
+        if self._delete_by_lookup:
+            lookup = vars(path_parameters) if path_parameters else {}
+            deleted, _ = model.objects.filter(**lookup).delete()
+            if not deleted:
+                raise model.DoesNotExist(
+                    f"{model._meta.object_name} matching query does not exist."
+                )
+            return
+
+        using = router.db_for_write(model)
+        with transaction.atomic(using=using):
+            instance = self.get_model(request, path_parameters)
+            self.pre_delete(request, instance)
+            instance.delete()
+            transaction.on_commit(
+                functools.partial(self.post_delete, request, instance), using=using
+            )
 
     def _update_handler_annotations(
         self, handler: Callable[..., Any]
     ) -> Callable[..., Any]:
-        annotations = cast(FunctionType, handler).__annotations__
-        annotations["path_parameters"] = Annotated[
-            self.path_parameters, Path(default=None, include_in_schema=False)
-        ]
-        return handler
+        return self._annotate_handler(
+            handler,
+            path_parameters=Annotated[
+                self.path_parameters, Path(default=None, include_in_schema=False)
+            ],
+        )
 
     def _default_get_model(
         self, request: HttpRequest, path_parameters: Optional[BaseModel]
     ) -> Model:
-        return cast(type[Model], self.model).objects.get(
-            **(path_parameters.model_dump() if path_parameters else {})
+        model = cast(type[Model], self.model)
+        queryset = model.objects.select_for_update()
+        if (
+            self._has_default_hooks()
+            and model.delete is Model.delete
+            and not signals.pre_delete.has_listeners(model)
+            and not signals.post_delete.has_listeners(model)
+        ):
+            queryset = queryset.only("pk")
+        return queryset.get(**(vars(path_parameters) if path_parameters else {}))
+
+    def _has_default_hooks(self) -> bool:
+        return (
+            getattr(self.pre_delete, "__func__", None) is DeleteView._default_pre_delete
+            and getattr(self.post_delete, "__func__", None)
+            is DeleteView._default_post_delete
         )
 
+    def _default_pre_delete(self, request: HttpRequest, instance: Model) -> None:
+        pass
+
+    def _default_post_delete(self, request: HttpRequest, instance: Model) -> None:
+        pass
+
     def as_operation(self) -> dict[str, Any]:
         if self.api_viewset_class:
             self.model = self.model or self.api_viewset_class.model
@@ -140,4 +191,11 @@ class DeleteView(APIView):
         self.path_parameters = self.path_parameters or self.resolve_path_parameters(
             self.model
         )
+        self._delete_by_lookup = (
+            getattr(self.get_model, "__func__", None) is DeleteView._default_get_model
+            and self._has_default_hooks()
+            and self.path_parameters is not None
+            and self.model._meta.pk.name in self.path_parameters.model_fields
+            and self.model.delete is Model.delete
+        )
         return super().as_operation()
@@ -1,4 +1,3 @@
-from types import FunctionType
 from typing import Annotated, Any, Callable, Optional, Union, cast
 
 from django.db.models import Model, QuerySet
@@ -37,13 +36,19 @@ class ListView(APIView):
             Defaults to `None`.
         get_queryset (Callable | None, optional): Callable to retrieve the queryset.
             Default uses `self.model.objects.get_queryset()`. Useful for selecting
-            related models or optimizing queries. Should have the signature:
+            related models or optimizing queries, e.g., avoiding one query per item
+            when the response body includes related models with
+            `Employee.objects.select_related("department")`, or
+            `.prefetch_related(...)` for many-to-many relations. Prefetches only run
+            for the items of the current page, as pagination slices the queryset
+            before it is evaluated. Should have the signature:
             - `(request: HttpRequest, path_parameters: Optional[BaseModel]) -> QuerySet`
         filter_queryset (Callable | None, optional): Callable to filter the queryset.
             Default uses `query_parameters.filter(queryset)` if `query_parameters` is a
             `ninja.FilterSchema`, otherwise filters the queryset based on the query
             parameters as keyword arguments:
-            `queryset.filter(**query_parameters.model_dump(exclude_unset=True))`.
+            `queryset.filter(**query_parameters.model_dump(exclude_unset=True))`,
+            leaving the queryset untouched when no query parameters are set.
             Should have the signature:
             - `(queryset: QuerySet, query_parameters: BaseModel | None) -> QuerySet`
         pagination_class (type[PaginationBase], optional): Pagination class.
@@ -131,14 +136,15 @@ class ListView(APIView):
     def _update_handler_annotations(
         self, handler: Callable[..., Any]
     ) -> Callable[..., Any]:
-        annotations = cast(FunctionType, handler).__annotations__
-        annotations["path_parameters"] = Annotated[
-            self.path_parameters, Path(default=None, include_in_schema=False)
-        ]
-        annotations["query_parameters"] = Annotated[
-            self.query_parameters, Query(default=None, include_in_schema=False)
-        ]
-        return handler
+        return self._annotate_handler(
+            handler,
+            path_parameters=Annotated[
+                self.path_parameters, Path(default=None, include_in_schema=False)
+            ],
+            query_parameters=Annotated[
+                self.query_parameters, Query(default=None, include_in_schema=False)
+            ],
+        )
 
     def _default_get_queryset(
         self, request: HttpRequest, path_parameters: Optional[BaseModel]
@@ -150,7 +156,10 @@ class ListView(APIView):
     ) -> QuerySet[Model]:
         if isinstance(query_parameters, FilterSchema):
             queryset = query_parameters.filter(queryset)
-        elif isinstance(query_parameters, BaseModel):
+        elif (
+            isinstance(query_parameters, BaseModel)
+            and query_parameters.model_fields_set
+        ):
             queryset = queryset.filter(
                 **query_parameters.model_dump(exclude_unset=True)
             )
@@ -1,4 +1,3 @@
-from types import FunctionType
 from typing import Annotated, Any, Callable, Optional, Union, cast
 
 from django.db.models import ManyToManyField, Model
@@ -139,18 +138,19 @@ class UpdateView(APIView):
     def _update_handler_annotations(
         self, handler: Callable[..., Any]
     ) -> Callable[..., Any]:
-        annotations = cast(FunctionType, handler).__annotations__
-        annotations["path_parameters"] = Annotated[
-            self.path_parameters, Path(default=None, include_in_schema=False)
-        ]
-        annotations["request_body"] = Annotated[self.request_body, Body()]
-        return handler
+        return self._annotate_handler(
+            handler,
+            path_parameters=Annotated[
+                self.path_parameters, Path(default=None, include_in_schema=False)
+            ],
+            request_body=Annotated[self.request_body, Body()],
+        )
 
     def _default_get_model(
         self, request: HttpRequest, path_parameters: Optional[BaseModel]
     ) -> Model:
         return cast(type[Model], self.model).objects.get(
-            **(path_parameters.model_dump() if path_parameters else {})
+            **(vars(path_parameters) if path_parameters else {})
         )
 
     def as_operation(self) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 from http import HTTPStatus
 
+from django.contrib.auth.models import User
 from rest_testing import APITestCase, APIViewTestScenario
 
 from tests.test_app.schemas import UserResponseBody
@@ -147,3 +148,41 @@ class TestUserViewSet(APITestCase, BaseTestCase):
                 ),
             ],
         )
+
+    def test_bulk_delete_users(self):
+        user_3 = User.objects.create(
+            username="user-3", password="password", email="email3@example.com"
+        )
+        user_ids = [self.user_1.id, self.user_2.id, user_3.id]
+
+        def assert_users_remaining(*remaining_users):
+            def assertions(response, scenario):
+                self.assertQuerySetEqual(
+                    User.objects.filter(id__in=user_ids).order_by("id"),
+                    remaining_users,
+                )
+
+            return assertions
+
+        self.assertScenariosSucceed(
+            method="DELETE",
+            path="/api/users/",
+            scenarios=[
+                APIViewTestScenario(
+                    request_body={"ids": [self.user_1.id, self.user_2.id]},
+                    expected_response_status=HTTPStatus.NO_CONTENT,
+                    expected_response_body=b"",
+                    assertions=assert_users_remaining(user_3),
+                ),
+                APIViewTestScenario(
+                    request_body={"ids": []},
+                    expected_response_status=HTTPStatus.NO_CONTENT,
+                    expected_response_body=b"",
+                    assertions=assert_users_remaining(self.user_1, self.user_2, user_3),
+                ),
+                APIViewTestScenario(
+                    request_body={"ids": ["not-an-id"]},
+                    expected_response_status=HTTPStatus.BAD_REQUEST,
+                ),
+            ],
+        )
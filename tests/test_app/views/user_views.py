@@ -28,6 +28,7 @@ class UserViewSet(APIViewSet):
         request_body=UserRequestBody, response_body=UserResponseBody
     )
     delete_user = views.DeleteView()
+    bulk_delete_users = views.BulkDeleteView()
 
 
 UserViewSet.add_views_to(router)
@@ -1,3 +1,4 @@
+import copy
 import uuid
 from typing import Any
 from unittest import mock
@@ -111,6 +112,20 @@ class TestAPIView(TestCase):
             self.api_view.path = "/{nonexistent_field}"
             self.api_view.resolve_path_parameters(model=Item)
 
+    def test_resolve_path_parameters_cached(self):
+        self.api_view.path = "/{collection_id}/items/{id}"
+        path_parameters_type = self.api_view.resolve_path_parameters(model=Item)
+
+        other_api_view = copy.copy(self.api_view)
+        self.assertIs(
+            other_api_view.resolve_path_parameters(model=Item), path_parameters_type
+        )
+
+        self.api_view.path = "/{id}"
+        self.assertIsNot(
+            self.api_view.resolve_path_parameters(model=Item), path_parameters_type
+        )
+
     def test_resolve_response(self):
         model_1 = pydantic.create_model("Model1", field_1=(str, ...))
         model_2 = pydantic.create_model("Model2", field_2=(int, ...))
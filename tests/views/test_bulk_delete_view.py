@@ -0,0 +1,71 @@
+import uuid
+
+from django.contrib.auth.models import User
+from django.http import HttpRequest
+from django.test import TestCase
+from pydantic import BaseModel
+
+from ninja_crud import views, viewsets
+from tests.test_app.models import Collection, Item
+from tests.test_app.schemas import ItemIn, ItemOut
+
+
+class TestBulkDeleteView(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            username="user-1", password="password", email="email@example.com"
+        )
+        self.collection = Collection.objects.create(
+            name="collection", created_by=self.user
+        )
+        self.item1 = Item.objects.create(name="item1", collection=self.collection)
+        self.item2 = Item.objects.create(name="item2", collection=self.collection)
+        self.item3 = Item.objects.create(name="item3", collection=self.collection)
+        self.bulk_delete_view = views.BulkDeleteView(
+            model=Item,
+        )
+
+        class RequestBody(BaseModel):
+            ids: list[uuid.UUID]
+
+        self.RequestBody = RequestBody
+
+    def test_default_get_queryset_without_model(self):
+        bulk_delete_view = views.BulkDeleteView()
+        with self.assertRaises(ValueError):
+            bulk_delete_view.as_operation()
+
+    def test_resolve_request_body(self):
+        request_body_type = self.bulk_delete_view.resolve_request_body(model=Item)
+        self.assertEqual(
+            request_body_type.model_fields.get("ids").annotation, list[uuid.UUID]
+        )
+
+        request_body_type = self.bulk_delete_view.resolve_request_body(model=User)
+        self.assertEqual(
+            request_body_type.model_fields.get("ids").annotation, list[int]
+        )
+
+    def test_default_view_function(self):
+        request_body = self.RequestBody(ids=[self.item1.id, self.item2.id])
+        with self.assertNumQueries(3):
+            self.bulk_delete_view.handler(HttpRequest(), None, request_body)
+
+        self.assertEqual(list(Item.objects.all()), [self.item3])
+
+    def test_set_api_viewset_class(self):
+        bulk_delete_view = views.BulkDeleteView()
+
+        class ItemViewSet(viewsets.APIViewSet):
+            model = Item
+            default_request_body = ItemIn
+            default_response_body = ItemOut
+
+        bulk_delete_view.api_viewset_class = ItemViewSet
+        bulk_delete_view.as_operation()
+        self.assertEqual(bulk_delete_view.model, Item)
+        self.assertEqual(bulk_delete_view.response_schema, None)
+        self.assertEqual(
+            bulk_delete_view.request_body.model_fields.get("ids").annotation,
+            list[uuid.UUID],
+        )
@@ -1,7 +1,9 @@
 import uuid
+from unittest import mock
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Model, signals
 from django.http import HttpRequest
 from django.test import TestCase
 from pydantic import BaseModel
@@ -42,14 +44,93 @@ class TestDeleteView(TestCase):
 
         self.assertIsInstance(model_instance, Item)
         self.assertEqual(model_instance.id, self.item.id)
+        self.assertEqual(
+            model_instance.get_deferred_fields(),
+            {"name", "description", "collection_id"},
+        )
+
+    def test_default_get_model_with_hooks(self):
+        delete_view = views.DeleteView(
+            model=Item, pre_delete=lambda request, instance: None
+        )
+        path_parameters = self.PathParameters(id=self.item.id)
+        model_instance = delete_view._default_get_model(HttpRequest(), path_parameters)
+
+        self.assertEqual(model_instance.id, self.item.id)
+        self.assertEqual(model_instance.get_deferred_fields(), set())
+
+    def test_default_get_model_with_overridden_model_delete(self):
+        descriptions = []
+
+        def delete(instance, *args, **kwargs):
+            descriptions.append(instance.description)
+            return Model.delete(instance, *args, **kwargs)
+
+        path_parameters = self.PathParameters(id=self.item.id)
+        with mock.patch.object(Item, "delete", delete):
+            model_instance = self.delete_view._default_get_model(
+                HttpRequest(), path_parameters
+            )
+            self.assertEqual(model_instance.get_deferred_fields(), set())
+
+            with self.assertNumQueries(2):
+                model_instance.delete()
+
+        self.assertEqual(descriptions, [None])
+
+    def test_default_get_model_with_signal_receivers(self):
+        descriptions = []
+
+        def receiver(sender, instance, **kwargs):
+            descriptions.append(instance.description)
+
+        signals.post_delete.connect(receiver, sender=Item)
+        self.addCleanup(signals.post_delete.disconnect, receiver, sender=Item)
+        self.item.description = "description"
+        self.item.save()
+
+        path_parameters = self.PathParameters(id=self.item.id)
+        model_instance = self.delete_view._default_get_model(
+            HttpRequest(), path_parameters
+        )
+        self.assertEqual(model_instance.get_deferred_fields(), set())
+
+        delete_view = views.DeleteView(model=Item, path="/{name}")
+        delete_view.as_operation()
+        delete_view.handler(
+            HttpRequest(), delete_view.path_parameters(name=self.item.name)
+        )
+
+        self.assertFalse(Item.objects.filter(id=self.item.id).exists())
+        self.assertEqual(descriptions, ["description"])
 
     def test_default_view_function(self):
+        self.delete_view.as_operation()
         path_parameters = self.PathParameters(id=self.item.id)
         self.delete_view.handler(HttpRequest(), path_parameters)
 
         with self.assertRaises(ObjectDoesNotExist):
             Item.objects.get(id=self.item.id)
 
+        with self.assertRaises(Item.DoesNotExist):
+            self.delete_view.handler(HttpRequest(), path_parameters)
+
+    def test_default_view_function_with_hooks(self):
+        deleted_instances = []
+        delete_view = views.DeleteView(
+            model=Item,
+            pre_delete=lambda request, instance: deleted_instances.append(
+                instance.name
+            ),
+        )
+        delete_view.as_operation()
+        path_parameters = self.PathParameters(id=self.item.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_view.handler(HttpRequest(), path_parameters)
+
+        self.assertEqual(deleted_instances, [self.item.name])
+        self.assertFalse(Item.objects.filter(id=self.item.id).exists())
+
     def test_set_api_viewset_class(self):
         delete_view = views.DeleteView()
 
@@ -62,3 +143,119 @@ class TestDeleteView(TestCase):
         delete_view.as_operation()
         self.assertEqual(delete_view.model, Item)
         self.assertEqual(delete_view.response_schema, None)
+
+    def test_default_view_function_cascade_num_queries(self):
+        Item.objects.create(name="item-2", collection=self.collection)
+        delete_view = views.DeleteView(model=Collection)
+        delete_view.as_operation()
+        path_parameters = self.PathParameters(id=self.collection.id)
+
+        # The deletion collector fetches each cascaded relation in bulk, so the
+        # number of queries does not grow with the number of related instances.
+        with self.assertNumQueries(5):
+            delete_view.handler(HttpRequest(), path_parameters)
+
+        self.assertFalse(Item.objects.filter(collection=self.collection).exists())
+
+    def test_default_view_function_rolls_back_on_hook_error(self):
+        def pre_delete(request, instance):
+            raise RuntimeError()
+
+        delete_view = views.DeleteView(model=Item, pre_delete=pre_delete)
+        delete_view.as_operation()
+        path_parameters = self.PathParameters(id=self.item.id)
+        with self.assertRaises(RuntimeError):
+            delete_view.handler(HttpRequest(), path_parameters)
+
+        self.assertTrue(Item.objects.filter(id=self.item.id).exists())
+
+    def test_delete_by_lookup(self):
+        self.assertFalse(self.delete_view._delete_by_lookup)
+        self.delete_view.as_operation()
+        self.assertTrue(self.delete_view._delete_by_lookup)
+
+        delete_view = views.DeleteView(model=Item, path="/{name}")
+        delete_view.as_operation()
+        self.assertFalse(delete_view._delete_by_lookup)
+
+        delete_view = views.DeleteView(
+            model=Item, get_model=lambda request, path_parameters: self.item
+        )
+        delete_view.as_operation()
+        self.assertFalse(delete_view._delete_by_lookup)
+
+    def test_delete_by_lookup_with_overridden_model_delete(self):
+        deleted_instances = []
+
+        def delete(instance, *args, **kwargs):
+            deleted_instances.append(instance.name)
+            return Model.delete(instance, *args, **kwargs)
+
+        with mock.patch.object(Item, "delete", delete):
+            self.delete_view.as_operation()
+            self.assertFalse(self.delete_view._delete_by_lookup)
+
+            path_parameters = self.PathParameters(id=self.item.id)
+            self.delete_view.handler(HttpRequest(), path_parameters)
+
+        self.assertEqual(deleted_instances, [self.item.name])
+        self.assertFalse(Item.objects.filter(id=self.item.id).exists())
+
+    def test_delete_by_lookup_with_overriding_subclass(self):
+        audited_instances = []
+
+        class ScopedDeleteView(views.DeleteView):
+            def _default_get_model(self, request, path_parameters):
+                return Item.objects.get(
+                    collection__created_by=request.user, id=path_parameters.id
+                )
+
+        class AuditedDeleteView(views.DeleteView):
+            def _default_pre_delete(self, request, instance):
+                audited_instances.append(instance.name)
+
+        for view_class in [ScopedDeleteView, AuditedDeleteView]:
+            delete_view = view_class(model=Item)
+            delete_view.as_operation()
+            self.assertFalse(delete_view._delete_by_lookup)
+
+        other_user = User.objects.create(username="user-2", email="other@example.com")
+        request = HttpRequest()
+        request.user = other_user
+        delete_view = ScopedDeleteView(model=Item)
+        delete_view.as_operation()
+        with self.assertRaises(Item.DoesNotExist):
+            delete_view.handler(request, self.PathParameters(id=self.item.id))
+
+        self.assertTrue(Item.objects.filter(id=self.item.id).exists())
+
+        delete_view = AuditedDeleteView(model=Item)
+        delete_view.as_operation()
+        delete_view.handler(HttpRequest(), self.PathParameters(id=self.item.id))
+
+        self.assertEqual(audited_instances, [self.item.name])
+        self.assertFalse(Item.objects.filter(id=self.item.id).exists())
+
+    def test_default_view_function_post_delete_on_commit(self):
+        deleted_instances = []
+        delete_view = views.DeleteView(
+            model=Item,
+            post_delete=lambda request, instance: deleted_instances.append(
+                instance.name
+            ),
+        )
+        delete_view.as_operation()
+        path_parameters = self.PathParameters(id=self.item.id)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            delete_view.handler(HttpRequest(), path_parameters)
+            self.assertEqual(deleted_instances, [])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(deleted_instances, [self.item.name])
+
+    def test_as_operation_keeps_class_handler_annotations(self):
+        annotations = dict(views.DeleteView.handler.__annotations__)
+        view_func = self.delete_view.as_operation()["view_func"]
+
+        self.assertEqual(views.DeleteView.handler.__annotations__, annotations)
+        self.assertNotEqual(view_func.__annotations__, annotations)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from django.contrib.auth.models import User
 from django.db.models import QuerySet
 from django.http import HttpRequest
@@ -49,6 +51,18 @@ class TestListView(TestCase):
         self.assertIsInstance(filtered_queryset, QuerySet)
         self.assertEqual(list(filtered_queryset), [self.item1])
 
+    def test_default_filter_queryset_with_unset_schema(self):
+        queryset = Item.objects.all()
+
+        class QueryParameters(Schema):
+            name: Optional[str] = None
+
+        filtered_queryset = self.list_view._default_filter_queryset(
+            queryset, QueryParameters()
+        )
+
+        self.assertIs(filtered_queryset, queryset)
+
     def test_default_filter_queryset_with_filter_schema(self):
         queryset = Item.objects.all()
 
@@ -82,3 +96,19 @@ class TestListView(TestCase):
         list_view.as_operation()
         self.assertEqual(list_view.model, Item)
         self.assertEqual(list_view.response_schema, list[ItemOut])
+
+    def test_as_operation_keeps_class_handler_annotations(self):
+        annotations = dict(views.ListView.handler.__annotations__)
+        view_func = self.list_view.as_operation()["view_func"]
+
+        self.assertEqual(views.ListView.handler.__annotations__, annotations)
+        self.assertNotEqual(view_func.__annotations__, annotations)
+
+    def test_decorators_not_shared(self):
+        decorators = [lambda func: func]
+        list_view_1 = views.ListView(model=Item, decorators=decorators)
+        list_view_2 = views.ListView(model=Item, decorators=decorators)
+
+        self.assertEqual(len(decorators), 1)
+        self.assertEqual(list_view_1.decorators[0], list_view_2.decorators[0])
+        self.assertIsNot(list_view_1.decorators, list_view_2.decorators)